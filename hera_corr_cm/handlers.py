@@ -3,6 +3,7 @@ from __future__ import print_function
 import logging
 import logging.handlers
 import sys
+import time
 import redis
 import json
 import socket
@@ -44,8 +45,6 @@ class RedisHandler(logging.Handler):
 
 class HeraMCHandler(logging.Handler):
     def __init__(self, subsystem, channel, conn, *args, **kwargs):
-        from astropy.time import Time
-        self.Time = Time
         logging.Handler.__init__(self, *args, **kwargs)
         self.subsystem = subsystem
         self.channel = channel
@@ -60,19 +59,18 @@ class HeraMCHandler(logging.Handler):
             "levelno": record.levelno,
             "severity": severity,
             "message": self.format(record),
-            "logtime": self.Time.now().unix,
+            # same value as astropy's Time.now().unix, without its overhead
+            "logtime": time.time(),
         }
         self.redis_conn.publish(self.channel, json.dumps(record_dict))
 
 
 def log_notify(log, message=None):
     """Nofify upon start."""
-    msg = (message
-           or "{logname} starting on {host}".format(logname=log.name,
-                                                    host=socket.gethostname()
-                                                    )
-           )
-    log.log(NOTIFY, msg)
+    if message:
+        log.log(NOTIFY, message)
+    else:
+        log.log(NOTIFY, "%s starting on %s", log.name, socket.gethostname())
 
 
 def add_default_log_handlers(logger, redishostname='redishost', fglevel=logging.INFO,
@@ -100,7 +98,7 @@ def add_default_log_handlers(logger, redishostname='redishost', fglevel=logging.
     try:
         redis_host.ping()
     except redis.ConnectionError:
-        logger.warn("Couldn't connect to redis server at {}".format(redishostname))
+        logger.warning("Couldn't connect to redis server at %s", redishostname)
         return logger
 
     redis_handler = RedisHandler('log-channel', redis_host)
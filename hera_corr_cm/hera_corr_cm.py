@@ -1,18 +1,26 @@
 """HERA MC class."""
 from __future__ import print_function, absolute_import
 
+import re
+import copy
 import sys
 import time
 import redis
 import logging
 import yaml
 import json
+import hashlib
 import dateutil.parser
 import datetime
 import numpy as np
 from .handlers import add_default_log_handlers
 from . import __package__, __version__
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
 # this is identical to six.string_type but we don't want six dependence
 if sys.version_info.major > 2:
     string_type = str
@@ -20,6 +28,181 @@ else:
     string_type = basestring  # noqa
 N_CHAN = 16384
 SAMPLE_RATE = 500e6
+# Duration of a single spectrum, in seconds
+SPECTRUM_PERIOD = (2.0 * N_CHAN) / SAMPLE_RATE
+
+# Hashes holding the correlator state flags, each with "state" and "time" fields.
+_STATE_KEYS = (
+    "corr:is_taking_data",
+    "corr:status_phase_switch",
+    "corr:status_noise_diode",
+    "corr:status_load",
+)
+
+# Use the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.FullLoader)
+# Number of parsed configurations each HeraCorrCM instance keeps around.
+_CONFIG_CACHE_SIZE = 4
+
+# Precompiled number patterns used to screen values before conversion, so the
+# common "None" sentinel in status hashes does not cost an exception.
+# Digit runs may contain single underscores, as float() and int() accept.
+_DIGITS = r'\d(_?\d)*'
+_FLOAT_RE = re.compile(
+    r'^\s*[-+]?(({d}(\.({d})?)?|\.{d})([eE][-+]?{d})?|inf(inity)?|nan)\s*$'.format(d=_DIGITS),
+    re.IGNORECASE
+)
+_INT_RE = re.compile(r'^\s*[-+]?{d}\s*$'.format(d=_DIGITS))
+
+# ISO 8601 parsers for the timestamps written by the monitoring daemons, tried
+# before falling back to the (much slower) generic dateutil parser. Use the
+# fastest available: ciso8601, then the C-implemented datetime.fromisoformat
+# (python >= 3.7), then strptime on the known formats.
+if _parse_iso8601 is not None:
+    _TIMESTAMP_PARSERS = (_parse_iso8601,)
+elif hasattr(datetime.datetime, "fromisoformat"):
+    _TIMESTAMP_PARSERS = (datetime.datetime.fromisoformat,)
+else:
+    _TIMESTAMP_PARSERS = tuple(
+        lambda v, fmt=fmt: datetime.datetime.strptime(v, fmt)
+        for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f")
+    )
+
+
+def _parse_timestamp(v):
+    """Parse a timestamp string into a datetime, preferring fast ISO 8601 paths."""
+    for parse in _TIMESTAMP_PARSERS:
+        try:
+            return parse(v)
+        except ValueError:
+            continue
+    return dateutil.parser.parse(v)
+
+
+# Conversion tables for the snap status hashes. Each entry is
+#     (name of the variable in the returned dictionary,
+#      redis key name,
+#      conversion method from redis to the returned value,
+#      arg for conversion method,
+#      dtype to cast the converted value to).
+# Entries with an arg are passed the raw bytes, all others the decoded string.
+# Redis key names may contain the templates {$CH} (SNAP input stream),
+# {$PF} (PAM/FEM index) and {$POL} (polarization), filled in per antenna.
+_F_STATUS_CONV = (
+    ('is_programmed', 'is_programmed', lambda x: (x == 'True'), None, None),
+    ('adc_is_configured', 'adc_is_configured', lambda x: (x == '1'), None, None),
+    ('is_initialized', 'is_initialized', lambda x: (x == '1'), None, None),
+    ('dest_is_configured', 'dest_is_configured', lambda x: (x == '1'), None, None),
+    ('version', 'version', str, None, None),
+    ('sample_rate', 'sample_rate', float, None, None),
+    ('input', 'input', str, None, None),
+    ('pmb_alert', 'pmb_alert', lambda x: bool(int(x)), None, None),
+    ('pps_count', 'pps_count', int, None, None),
+    ('serial', 'serial', str, None, None),
+    ('temp', 'temp', float, None, None),
+    ('uptime', 'uptime', int, None, None),
+    ('last_programmed', 'last_programmed', _parse_timestamp, None, None),
+    ('timestamp', 'timestamp', _parse_timestamp, None, None),
+)
+
+_ANT_STATUS_CONV = (
+    ('adc_mean', 'stream{$CH}_mean', float, None, None),
+    ('adc_rms', 'stream{$CH}_rms', float, None, None),
+    ('adc_power', 'stream{$CH}_power', float, None, None),
+    ('pam_atten', 'pam{$PF}_atten_{$POL}', int, None, None),
+    ('pam_power', 'pam{$PF}_power_{$POL}', float, None, None),
+    ('pam_voltage', 'pam{$PF}_voltage', float, None, None),
+    ('pam_current', 'pam{$PF}_current', float, None, None),
+    ('eq_coeffs', 'stream{$CH}_eq_coeffs', np.frombuffer, float, np.float32),
+    ('histogram', 'stream{$CH}_hist', np.frombuffer, int, int),
+    ('autocorrelation', 'stream{$CH}_autocorr', np.frombuffer, float, np.float32),
+    ('fem_lna_power', 'fem{$PF}_lna_power_{$POL}', lambda x: (x == 'True'), None, None),
+    ('pam_id', 'pam{$PF}_id', json.loads, None, None),
+    ('fem_temp', 'fem{$PF}_temp', float, None, None),
+    ('fem_voltage', 'fem{$PF}_voltage', float, None, None),
+    ('fem_current', 'fem{$PF}_current', float, None, None),
+    ('fem_pressure', 'fem{$PF}_pressure', float, None, None),
+    ('fem_humidity', 'fem{$PF}_humidity', float, None, None),
+    ('fem_id', 'fem{$PF}_id', json.loads, None, None),
+    ('fem_switch', 'fem{$PF}_switch', str, None, None),
+    ('fem_imu_theta', 'fem{$PF}_imu_theta', float, None, None),
+    ('fem_imu_phi', 'fem{$PF}_imu_phi', float, None, None),
+    ('timestamp', 'timestamp', _parse_timestamp, None, None),
+    ('clip_count', 'eq_clip_count', int, None, None),
+    ('fft_of', 'fft_overflow', lambda x: (x == 'True'), None, None),
+)
+
+_SNAPRF_STATUS_CONV = (
+    ('timestamp', 'timestamp', _parse_timestamp, None, None),
+    ('mean', 'stream{$CH}_mean', float, None, None),
+    ('rms', 'stream{$CH}_rms', float, None, None),
+    ('power', 'stream{$CH}_power', float, None, None),
+    ('eq_coeffs', 'stream{$CH}_eq_coeffs', np.frombuffer, float, np.float32),
+    ('histogram', 'stream{$CH}_hist', np.frombuffer, int, int),
+    ('autocorrelation', 'stream{$CH}_autocorr', np.frombuffer, float, np.float32),
+)
+
+
+def _convert_status(stats, conv_items, subs=()):
+    """
+    Convert a raw snap status hash using one of the conversion tables above.
+
+    Args:
+        stats (dict): HGETALL of a status:snap:* key, with undecoded values.
+        conv_items (tuple): Conversion table, e.g. `_ANT_STATUS_CONV`.
+        subs (tuple): (template, value) pairs to substitute into the redis key names.
+
+    Returns: dictionary of converted values (None where conversion failed),
+        number of values successfully converted
+    """
+    rv = {}
+    n_converted = 0
+    for key, ckey, cfunc, carg, ccst in conv_items:
+        for template, value in subs:
+            ckey = ckey.replace(template, value)
+        try:
+            if carg is not None:
+                rv[key] = cfunc(stats[ckey], carg).astype(ccst)
+            else:
+                rv[key] = cfunc(stats[ckey].decode())
+            n_converted += 1
+        except Exception:
+            rv[key] = None
+    return rv, n_converted
+
+
+# Redis connection pools shared by every client in this process, keyed by
+# (redis host, decode_responses), or by connection class and kwargs for the
+# non-decoding pools matching a caller-supplied pool.
+_connection_pools = {}
+
+
+def _get_connection_pool(redishost, decode_responses=True):
+    """Return the shared connection pool for `redishost`, creating it on first use."""
+    key = (redishost, decode_responses)
+    if key not in _connection_pools:
+        _connection_pools[key] = redis.BlockingConnectionPool(
+            host=redishost,
+            max_connections=100,
+            decode_responses=decode_responses,
+            health_check_interval=30,
+            socket_keepalive=True,
+        )
+    return _connection_pools[key]
+
+
+def _get_raw_connection_pool(connection_pool):
+    """Return a shared non-decoding pool for the same server as `connection_pool`."""
+    kwargs = dict(connection_pool.connection_kwargs, decode_responses=False)
+    # Some connection kwargs (e.g. retry or ssl settings) are not hashable,
+    # so key on their repr.
+    key = (connection_pool.connection_class,
+           tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    if key not in _connection_pools:
+        _connection_pools[key] = redis.ConnectionPool(
+            connection_class=connection_pool.connection_class, **kwargs
+        )
+    return _connection_pools[key]
 
 
 class HeraCorrCM(object):
@@ -29,12 +212,13 @@ class HeraCorrCM(object):
     Enable control of SNAP boards, and X-engines via a redis message store.
     """
 
-    # A class-wide variable to hold redis connections.
-    # This prevents multiple instances of HeraCorrCM
-    # from creating lots and lots (and lots) of redis connections
+    # Deprecated: clients by redis host (and "<host>:encoded"), kept for code
+    # which reads this mapping. Connections are now shared through the
+    # module-level pools, so clearing it no longer closes anything.
     redis_connections = {}
 
-    def __init__(self, redishost="redishost", logger=None, danger_mode=False, include_fpga=False):
+    def __init__(self, redishost="redishost", logger=None, danger_mode=False, include_fpga=False,
+                 connection_pool=None):
         """
         Create a connection to the correlator via a redis server.
 
@@ -48,6 +232,12 @@ class HeraCorrCM(object):
                 F-engines.
             danger_mode (Boolean): If True, disables the
                                    only-allow-command-when-not-observing checks.
+            connection_pool (redis.ConnectionPool): A pool, created with
+                decode_responses=True, to use instead of the shared pool for
+                `redishost`. This lets callers which already hold a redis client
+                share its connections with this instance. Its server is used
+                in place of `redishost`. Raises ValueError if the pool does
+                not decode responses.
         """
         if logger is None:
             logger = add_default_log_handlers(
@@ -55,26 +245,34 @@ class HeraCorrCM(object):
             )
         self.logger = logger
         self.danger_mode = danger_mode
-        # If the redishost is one we've already connected to, use it again.
-        # Otherwise, add it.
-        # Also share response channels. This opens the door to all sorts of
-        # unintended consequences if you try to multithread access to
-        # multiple HeraCorrCM instances in the same program. But in most cases
-        # sharing means the code will just do The Right Thing, and won't leave
-        # a trail of a orphaned connections.
-        redis_encoded = redishost + ':encoded'
-        if redishost not in list(self.redis_connections.keys()):
-            self.redis_connections[redishost] = redis.Redis(redishost,
-                                                            max_connections=100,
-                                                            decode_responses=True)
-            self.redis_connections[redis_encoded] = redis.Redis(redishost)
-        self.r = self.redis_connections[redishost]
-        self.renc = self.redis_connections[redis_encoded]
-
-    def is_recording(self):
+        # Clients are cheap wrappers around process-wide connection pools, so
+        # many HeraCorrCM instances share sockets rather than each opening
+        # (and orphaning) their own connections.
+        if connection_pool is None:
+            connection_pool = _get_connection_pool(redishost)
+            raw_pool = _get_connection_pool(redishost, decode_responses=False)
+        else:
+            if not connection_pool.connection_kwargs.get("decode_responses"):
+                raise ValueError("connection_pool must be created with decode_responses=True")
+            # Read undecoded values from the same server as the given pool.
+            raw_pool = _get_raw_connection_pool(connection_pool)
+        self.r = redis.Redis(connection_pool=connection_pool)
+        self.renc = redis.Redis(connection_pool=raw_pool)
+        self.redis_connections[redishost] = self.r
+        self.redis_connections[redishost + ':encoded'] = self.renc
+        # Parsed configuration structures, keyed by their md5 hash. The SNAP
+        # init-time configuration is kept separately from the current one.
+        self._config_cache = {}
+        self._init_config_cache = {}
+
+    def is_recording(self, snapshot=None):
         """
         Check if recording.
 
+        Args:
+            snapshot (dict): Optional result of `get_state_snapshot` to read
+                the state from, instead of querying redis.
+
         Returns: recording_state, UNIX time of last state change (float)
         recording_state is True if the correlator is currently taking data.
 
@@ -82,56 +280,103 @@ class HeraCorrCM(object):
               when it stopped (e.g., because it was not shutdown gracefully)
               the returned time will be `None`
         """
-        if not self.r.exists("corr:is_taking_data"):
+        state, t = self._get_state("corr:is_taking_data", snapshot)
+        if state is None:
             return False, None
-        else:
-            x = self._hgetall("corr:is_taking_data")
-            return x["state"] == "True", float(x["time"])
+        return state == "True", float(t)
 
-    def _conv_float(self, v):
-        """Try and convert v into a float. If we can't, return None."""
+    def wait_for_recording_state(self, target_state, timeout=30.0, max_wait=1.0):
+        """
+        Block until the correlator recording state matches `target_state`.
+
+        Rather than polling `is_recording`, this subscribes to redis keyspace
+        notifications for corr:is_taking_data and only re-reads the state when
+        the key changes. This requires the redis server to be configured with
+        `notify-keyspace-events` including "Kh". If notifications are not enabled
+        the state is still re-checked every `max_wait` seconds.
+
+        Args:
+            target_state (bool): The recording state to wait for.
+            timeout (float): Maximum time to wait, in seconds.
+            max_wait (float): Maximum time to block between state checks, in seconds.
+
+        Returns: True if the target state was reached, False on timeout.
+        """
+        pubsub = self.r.pubsub(ignore_subscribe_messages=True)
+        # Subscribe before the first check, so a change between the check
+        # and the subscription cannot be missed.
+        pubsub.psubscribe("__keyspace@*__:corr:is_taking_data")
         try:
-            return float(v)
-        except ValueError:
-            return None
+            deadline = time.monotonic() + timeout
+            while True:
+                if self.is_recording()[0] == target_state:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                pubsub.get_message(timeout=min(remaining, max_wait))
+        finally:
+            pubsub.close()
+
+    def _conv_float(self, v):
+        """Try and convert v (str or bytes) into a float. If we can't, return None."""
+        if isinstance(v, bytes):
+            v = v.decode()
+        return float(v) if _FLOAT_RE.match(v) else None
 
     def _conv_int(self, v):
-        """Try and convert v into an int. If we can't, return None."""
-        try:
-            return int(v)
-        except ValueError:
-            return None
+        """Try and convert v (str or bytes) into an int. If we can't, return None."""
+        if isinstance(v, bytes):
+            v = v.decode()
+        return int(v) if _INT_RE.match(v) else None
 
-    def next_start_time(self):
+    def next_start_time(self, snapshot=None):
         """
         Return next start time.
 
         Return the last trigger time (as a UNIX timestamp float) sent to the correlator.
         If this is in the future, the correlator is waiting to start taking data.
         If no valid timestamp exists, return 0.
+
+        Args:
+            snapshot (dict): Optional result of `get_state_snapshot` to read
+                the state from, instead of querying redis.
         """
-        if self.r.exists("corr:trig_time"):
-            return float(self.r["corr:trig_time"])
+        if snapshot is not None:
+            trig_time = snapshot["corr:trig_time"]
         else:
-            return 0.0
+            trig_time = self.r.get("corr:trig_time")
+        return 0.0 if trig_time is None else float(trig_time)
 
     def secs_to_n_spectra(self, secs):
-        """Return the number of spectra in a given interval of `secs` seconds."""
-        return secs / ((2.0 * N_CHAN) / SAMPLE_RATE)
+        """
+        Return the number of spectra in a given interval of `secs` seconds.
+
+        `secs` may also be a numpy array, in which case an array is returned.
+        """
+        return secs / SPECTRUM_PERIOD
 
     def n_spectra_to_secs(self, n):
-        """Return the time interval in seconds corresponding to `n` spectra."""
-        return n * ((2.0 * N_CHAN) / SAMPLE_RATE)
+        """
+        Return the time interval in seconds corresponding to `n` spectra.
 
-    def phase_switch_is_on(self):
+        `n` may also be a numpy array, in which case an array is returned.
+        """
+        return n * SPECTRUM_PERIOD
+
+    def phase_switch_is_on(self, snapshot=None):
         """
         Check phase switch state.
 
+        Args:
+            snapshot (dict): Optional result of `get_state_snapshot` to read
+                the state from, instead of querying redis.
+
         Returns: enable_state, UNIX timestamp (float) of last state change
         enable_state is True if phase switching is on. Else False.
+        Raises KeyError if the state has never been set.
         """
-        x = self._hgetall("corr:status_phase_switch")
-        return x["state"] == "on", float(x["time"])
+        return self._get_switch_state("corr:status_phase_switch", snapshot)
 
     def update_config(self, configfile):
         """
@@ -144,42 +389,77 @@ class HeraCorrCM(object):
             configfile: A path to a valid correlator configuration
                 yaml file.
         """
-        with open(configfile, "r") as fh:
-            upload_time = time.time()
-            self.r.hmset("snap_configuration", {"config": fh.read(), "upload_time": upload_time,
-                         "upload_time_str": time.ctime(upload_time)})
+        with open(configfile, "rb") as fh:
+            config = fh.read()
+        upload_time = time.time()
+        # Store the hash with the config, since get_config caches against it.
+        self.r.hset("snap_configuration", mapping={"config": config,
+                                                   "md5": hashlib.md5(config).hexdigest(),
+                                                   "upload_time": upload_time,
+                                                   "upload_time_str": time.ctime(upload_time)})
 
     def get_config(self):
         """
         Get the currently loaded configuration, as a processed yaml string.
 
+        The parsed structure is cached against the configuration hash, so
+        repeated calls only parse the yaml when the configuration changes.
+
         Returns: last update time (UNIX timestamp float), Configuration structure,
         configuration hash
         """
-        config = self.r.hget("snap_configuration", "config")
-        config_time = self.r.hget("snap_configuration", "upload_time")
-        md5 = self.r.hget("snap_configuration", "md5")
-        return float(config_time), yaml.load(config, Loader=yaml.FullLoader), md5
+        md5, config_time = self._hmget("snap_configuration", "md5", "upload_time")
+        if md5 not in self._config_cache:
+            # Read the config with its hash and time, so an upload in between
+            # can't pair the new config with the old hash.
+            config, config_time, md5 = self._hmget("snap_configuration",
+                                                   "config", "upload_time", "md5")
+            return float(config_time), self._load_config(self._config_cache, md5, config), md5
+        return float(config_time), copy.deepcopy(self._config_cache[md5]), md5
+
+    def _load_config(self, cache, md5, config):
+        """
+        Parse a yaml configuration string, caching the result in `cache` against its md5 hash.
+
+        Only the most recently parsed few configurations are kept. A copy of the
+        parsed structure is returned, so callers may modify it.
+        """
+        if md5 not in cache:
+            parsed = yaml.load(config, Loader=_YAML_LOADER)
+            if md5 is None:
+                return parsed
+            if len(cache) >= _CONFIG_CACHE_SIZE:
+                cache.clear()
+            cache[md5] = parsed
+        return copy.deepcopy(cache[md5])
 
-    def noise_diode_is_on(self):
+    def noise_diode_is_on(self, snapshot=None):
         """
         Return if noise diode is on.
 
+        Args:
+            snapshot (dict): Optional result of `get_state_snapshot` to read
+                the state from, instead of querying redis.
+
         Returns: enable_state, UNIX timestamp (float) of last state change
         enable_state is True if noise diode is on. Else False.
+        Raises KeyError if the state has never been set.
         """
-        x = self._hgetall("corr:status_noise_diode")
-        return x["state"] == "on", float(x["time"])
+        return self._get_switch_state("corr:status_noise_diode", snapshot)
 
-    def load_is_on(self):
+    def load_is_on(self, snapshot=None):
         """
         Return if load is on.
 
+        Args:
+            snapshot (dict): Optional result of `get_state_snapshot` to read
+                the state from, instead of querying redis.
+
         Returns: enable_state, UNIX timestamp (float) of last state change
         enable_state is True if load is on. Else False.
+        Raises KeyError if the state has never been set.
         """
-        x = self._hgetall("corr:status_load")
-        return x["state"] == "on", float(x["time"])
+        return self._get_switch_state("corr:status_load", snapshot)
 
     def get_eq_coeffs(self, ant, pol):
         """
@@ -239,7 +519,7 @@ class HeraCorrCM(object):
         rv = {}
         decode_responses = False if stattype == 'snap' else True
         for key in self.r.scan_iter(keystart + "*"):
-            rv[key.lstrip(keystart)] = self._hgetall(key, decode_responses=decode_responses)
+            rv[key[len(keystart):]] = self._hgetall(key, decode_responses=decode_responses)
         return rv
 
     def _hgetall(self, rkey, decode_responses=True):
@@ -253,6 +533,52 @@ class HeraCorrCM(object):
         else:
             return {key.decode(): val for key, val in self.renc.hgetall(rkey).items()}
 
+    def get_state_snapshot(self):
+        """
+        Read all correlator state flags in a single redis round trip.
+
+        The returned dictionary can be passed as the `snapshot` argument of
+        `is_recording`, `phase_switch_is_on`, `noise_diode_is_on`, `load_is_on`
+        and `next_start_time`, so that checking several of them costs one
+        round trip rather than one each.
+
+        Returns: dictionary of raw state values, keyed by redis key name
+        """
+        pipe = self.r.pipeline(transaction=False)
+        for key in _STATE_KEYS:
+            pipe.hmget(key, "state", "time")
+        pipe.get("corr:trig_time")
+        results = pipe.execute()
+        snapshot = dict(zip(_STATE_KEYS, results))
+        snapshot["corr:trig_time"] = results[-1]
+        return snapshot
+
+    def _get_state(self, rkey, snapshot=None):
+        """Return the (state, time) fields of a state hash, from `snapshot` if given."""
+        if snapshot is not None:
+            return snapshot[rkey]
+        return self._hmget(rkey, "state", "time")
+
+    def _get_switch_state(self, rkey, snapshot=None):
+        """
+        Return (state == "on", time) for an on/off state hash.
+
+        Raises KeyError if the hash does not exist, as reading the fields of a
+        missing hash always has.
+        """
+        state, t = self._get_state(rkey, snapshot)
+        if state is None:
+            raise KeyError(rkey)
+        return state == "on", float(t)
+
+    def _hmget(self, rkey, *fields):
+        """
+        Generate a wrapper around self.r.hmget(rkey, fields).
+
+        Returns a list of the requested field values, with None for missing fields.
+        """
+        return self.r.hmget(rkey, fields)
+
     def get_f_status(self):
         """
         Return a dictionary of snap status values.
@@ -285,33 +611,9 @@ class HeraCorrCM(object):
             of the listed keys above.
         """
         stats = self._get_status_keys("snap")
-        # For the conv_info dictionary below, the format is:
-        #     key: name of the variable in the return dictionary from this method
-        #     tuple:  (redis key name, conversion method from redis to this method).
-        conv_info = {
-            'is_programmed': ('is_programmed', lambda x: (x == 'True')),
-            'adc_is_configured': ('adc_is_configured', lambda x: (x == '1')),
-            'is_initialized': ('is_initialized', lambda x: (x == '1')),
-            'dest_is_configured': ('dest_is_configured', lambda x: (x == '1')),
-            'version': ('version', str),
-            'sample_rate': ('sample_rate', float),
-            'input': ('input', str),
-            'pmb_alert': ('pmb_alert', lambda x: bool(int(x))),
-            'pps_count': ('pps_count', int),
-            'serial': ('serial', str),
-            'temp': ('temp', float),
-            'uptime': ('uptime', int),
-            'last_programmed': ('last_programmed', dateutil.parser.parse),
-            'timestamp': ('timestamp', dateutil.parser.parse)
-        }
         f_status = {}
         for host, val in stats.items():
-            f_status[host] = {}
-            for key, (ckey, cfunc) in conv_info.items():
-                try:
-                    f_status[host][key] = cfunc(stats[host][ckey].decode())
-                except Exception as e:
-                    f_status[host][key] = None
+            f_status[host], _ = _convert_status(val, _F_STATUS_CONV)
         return f_status
 
     def get_ant_status(self):
@@ -360,37 +662,6 @@ class HeraCorrCM(object):
         assert(hookup is not None)  # antenna hookup missing in redis
         ant_to_snap = hookup['ant_to_snap']
         stats = self._get_status_keys("snap")
-        # For the conv_info dictionary below, the format is:
-        #     key: name of the variable in the return dictionary from this method
-        #     tuple:  (redis key name,
-        #              conversion method from redis to this method,
-        #              arg for conversion method).
-        conv_info = {
-            'adc_mean': ('stream{$CH}_mean', float, None, None),
-            'adc_rms': ('stream{$CH}_rms', float, None, None),
-            'adc_power': ('stream{$CH}_power', float, None, None),
-            'pam_atten': ('pam{$PF}_atten_{$POL}', int, None, None),
-            'pam_power': ('pam{$PF}_power_{$POL}', float, None, None),
-            'pam_voltage': ('pam{$PF}_voltage', float, None, None),
-            'pam_current': ('pam{$PF}_current', float, None, None),
-            'eq_coeffs': ('stream{$CH}_eq_coeffs', np.frombuffer, float, np.float32),
-            'histogram': ('stream{$CH}_hist', np.frombuffer, int, int),
-            'autocorrelation': ('stream{$CH}_autocorr', np.frombuffer, float, np.float32),
-            'fem_lna_power': ('fem{$PF}_lna_power_{$POL}', lambda x: (x == 'True'), None, None),
-            'pam_id': ('pam{$PF}_id', json.loads, None, None),
-            'fem_temp': ('fem{$PF}_temp', float, None, None),
-            'fem_voltage': ('fem{$PF}_voltage', float, None, None),
-            'fem_current': ('fem{$PF}_current', float, None, None),
-            'fem_pressure': ('fem{$PF}_pressure', float, None, None),
-            'fem_humidity': ('fem{$PF}_humidity', float, None, None),
-            'fem_id': ('fem{$PF}_id', json.loads, None, None),
-            'fem_switch': ('fem{$PF}_switch', str, None, None),
-            'fem_imu_theta': ('fem{$PF}_imu_theta', float, None, None),
-            'fem_imu_phi': ('fem{$PF}_imu_phi', float, None, None),
-            'timestamp': ('timestamp', dateutil.parser.parse, None, None),
-            'clip_count': ('eq_clip_count', int, None, None),
-            'fft_of': ('fft_overflow', lambda x: (x == 'True'), None, None)
-        }
         ant_status = {}
         for ant, vals in ant_to_snap.items():
             for pol, hostinfo in vals.items():
@@ -400,26 +671,12 @@ class HeraCorrCM(object):
                     continue
                 stream = hostinfo['channel']
                 antid = stream // 2
-                ant_status[antpol] = {'f_host': host, 'host_ant_id': stream}
-                not_exceptions = 0
-                for key, (ckey, cfunc, carg, ccst) in conv_info.items():
-                    ckey = ckey.replace('{$CH}', str(stream))
-                    ckey = ckey.replace('{$PF}', str(antid))
-                    ckey = ckey.replace('{$POL}', pol)
-                    if carg is not None:
-                        try:
-                            ant_status[antpol][key] = cfunc(stats[host][ckey], carg).astype(ccst)
-                            not_exceptions += 1
-                        except Exception as e:
-                            ant_status[antpol][key] = None
-                    else:
-                        try:
-                            ant_status[antpol][key] = cfunc(stats[host][ckey].decode())
-                            not_exceptions += 1
-                        except Exception as e:
-                            ant_status[antpol][key] = None
+                subs = (('{$CH}', str(stream)), ('{$PF}', str(antid)), ('{$POL}', pol))
+                status, not_exceptions = _convert_status(stats[host], _ANT_STATUS_CONV, subs)
                 if not_exceptions < 3:
-                    del(ant_status[antpol])
+                    continue
+                ant_status[antpol] = {'f_host': host, 'host_ant_id': stream}
+                ant_status[antpol].update(status)
         return ant_status
 
     def get_snaprf_status(self, numch=6):
@@ -446,36 +703,14 @@ class HeraCorrCM(object):
         """
 
         stats = self._get_status_keys("snap")
-        # For the conv_info dictionary below, the format is:
-        #     key: name of the variable in the return dictionary from this method
-        #     tuple:  (redis key name, conversion method from redis to this method).
-        conv_info = {
-            'timestamp': ('timestamp', dateutil.parser.parse, None, None),
-            'mean': ('stream{$CH}_mean', float, None, None),
-            'rms': ('stream{$CH}_rms', float, None, None),
-            'power': ('stream{$CH}_power', float, None, None),
-            'eq_coeffs': ('stream{$CH}_eq_coeffs', np.frombuffer, float, np.float32),
-            'histogram': ('stream{$CH}_hist', np.frombuffer, int, int),
-            'autocorrelation': ('stream{$CH}_autocorr', np.frombuffer, float, np.float32),
-        }
 
         rf_status = {}
         for host, hostinfo in stats.items():
             for stream in range(numch):
                 rfch = "{}:{}".format(host, stream)
-                rf_status[rfch] = {}
-                for key, (ckey, cfunc, carg, ccst) in conv_info.items():
-                    ckey = ckey.replace('{$CH}', str(stream))
-                    if carg is not None:
-                        try:
-                            rf_status[rfch][key] = cfunc(stats[host][ckey], carg).astype(ccst)
-                        except Exception as e:
-                            rf_status[rfch][key] = None
-                    else:
-                        try:
-                            rf_status[rfch][key] = cfunc(stats[host][ckey].decode())
-                        except Exception as e:
-                            rf_status[rfch][key] = None
+                rf_status[rfch], _ = _convert_status(
+                    hostinfo, _SNAPRF_STATUS_CONV, (('{$CH}', str(stream)),)
+                )
         return rf_status
 
     def get_x_status(self):
@@ -549,18 +784,26 @@ class HeraCorrCM(object):
         `hera_snap_feng_init.py` script. For the "snap" dictionary keys are:
             "version" : version string for the hera_corr_f package.
             "init_args" : arguments passed to the inialization script at runtime
-            "config" : Configuration structure used at initialization time
+            "config" : Configuration structure used at initialization time.
             "config_timestamp" : datetime instance indicating when this file was updated in redis
             "config_md5" : MD5 hash of this config file
             "timestamp" : datetime object indicating when the initialization script was called.
         """
+        # Fetch every version hash and the SNAP init hash in a single round trip.
+        version_keys = list(self.r.scan_iter("version:*", count=500))
+        pipe = self.r.pipeline(transaction=False)
+        for key in version_keys:
+            pipe.hgetall(key)
+        pipe.hgetall("init_configuration")
+        results = pipe.execute()
+        snap_init = results.pop()
+
         rv = {}
-        for key in self.r.scan_iter("version:*"):
-            newkey = key.lstrip("version:")
+        for key, x in zip(version_keys, results):
+            newkey = key[len("version:"):]
             rv[newkey] = {}
-            x = self._hgetall(key)
             rv[newkey]["version"] = x["version"]
-            rv[newkey]["timestamp"] = dateutil.parser.parse(x["timestamp"])
+            rv[newkey]["timestamp"] = _parse_timestamp(x["timestamp"])
 
         # Add this package
         rv[__package__] = {"version": __version__,
@@ -568,11 +811,11 @@ class HeraCorrCM(object):
                            }
 
         # SNAP init is a special case
-        snap_init = self._hgetall("init_configuration")
         rv["snap"] = {}
         rv["snap"]["version"] = snap_init["hera_corr_f_version"]
         rv["snap"]["init_args"] = snap_init["init_args"]
-        rv["snap"]["config"] = yaml.load(snap_init["config"], Loader=yaml.FullLoader)
+        rv["snap"]["config"] = self._load_config(self._init_config_cache, snap_init["md5"],
+                                                snap_init["config"])
         rv["snap"]["config_timestamp"] = datetime.datetime.utcfromtimestamp(float(snap_init["config_time"]))  # noqa
         rv["snap"]["config_md5"] = snap_init["md5"]
         rv["snap"]["timestamp"] = datetime.datetime.utcfromtimestamp(float(snap_init["init_time"]))
@@ -1,16 +1,21 @@
 """Redis functions for CM data."""
 
 import sys
+import copy
 import logging
 import logging.handlers
 import time
 import redis
+from concurrent.futures import ThreadPoolExecutor
 import json
 import socket
+import threading
 import numpy as np
 from astropy.coordinates import EarthLocation
 import astropy.units as u
 
+from .hera_corr_cm import _get_connection_pool
+
 # this is identical to six.string_type but we don't want six dependence
 if sys.version_info.major > 2:
     string_type = str
@@ -24,6 +29,34 @@ logging.addLevelName(NOTIFY, "NOTIFY")
 
 IS_INITIALIZED_ATTR = "_hera_has_default_handlers"
 
+# Parsed cminfo, keyed by redis server (host, port, unix socket path, db). Each entry is a dict with
+# the cm_version it was read at, and the "dict" and (lazily built) "namespace" forms.
+_cminfo_cache = {}
+_cminfo_lock = threading.Lock()
+
+
+def _get_redis(redishost):
+    """
+    Return a redis client for `redishost`.
+
+    Host names get a client on the process-wide connection pool for that host,
+    so repeated calls do not open new connections. Existing clients are
+    returned unchanged.
+    """
+    if isinstance(redishost, string_type):
+        return redis.Redis(connection_pool=_get_connection_pool(redishost))
+    return redishost
+
+
+def _snap_hostname(snap):
+    """Return the last alias of `snap` from a reverse lookup, or None on failure."""
+    try:
+        true_name, aliases, addresses = socket.gethostbyaddr(snap)
+    except:  # noqa
+        logger.error('Failed to gethostbyname for host %s', snap)
+        return None
+    return aliases[-1]
+
 
 def write_snap_hostnames_to_redis(redishost='redishost'):
     """
@@ -31,22 +64,20 @@ def write_snap_hostnames_to_redis(redishost='redishost'):
 
     This allows hera_mc to map hostnames to SNAP part numbers.
     """
-    if isinstance(redishost, str):
-        redishost = redis.Redis(redishost, decode_responses=True)
+    redishost = _get_redis(redishost)
     snap_host = {}
     snap_list = list(json.loads(redishost.hget('corr:map', 'all_snap_inputs')).keys())
-    for snap in snap_list:
-        try:
-            true_name, aliases, addresses = socket.gethostbyaddr(snap)
-        except:  # noqa
-            logger.error('Failed to gethostbyname for host %s' % snap)
-            continue
-        snap_host[snap] = aliases[-1]
+    # The lookups are independent and dominated by DNS latency, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        hostnames = list(executor.map(_snap_hostname, snap_list))
+    for snap, hostname in zip(snap_list, hostnames):
+        if hostname is not None:
+            snap_host[snap] = hostname
     redhash = {}
     redhash['snap_host'] = json.dumps(snap_host)
     redhash['snap_host_update_time'] = time.time()
     redhash['snap_host_update_time_str'] = time.ctime(redhash['snap_host_update_time'])
-    redishost.hmset('corr:map', redhash)
+    redishost.hset('corr:map', mapping=redhash)
 
 
 def hera_antpol_to_ant_pol(antpol):
@@ -57,11 +88,11 @@ def hera_antpol_to_ant_pol(antpol):
     return ant, pol
 
 
-def get_snaps_from_redis():
+def get_snaps_from_redis(redishost='redishost'):
     """Read SNAPs from redis - from CM, config and correlator viewpoints."""
     import yaml
 
-    r = redis.Redis('redishost', decode_responses=True)
+    r = _get_redis(redishost)
     snaps_cm_list = list(json.loads(r.hget('corr:map', 'all_snap_inputs')).keys())
     snap_to_host = json.loads(r.hget('corr:map', 'snap_host'))
     snaps = {'cm': [], 'cfg': [], 'corr': []}
@@ -77,8 +108,7 @@ def get_snaps_from_redis():
 
 def read_maps_from_redis(redishost='redishost'):
     """Read subset of corr:map."""
-    if isinstance(redishost, str):
-        redishost = redis.Redis(redishost, decode_responses=True)
+    redishost = _get_redis(redishost)
     if not redishost.exists('corr:map'):
         return None
     x = redishost.hgetall('corr:map')
@@ -101,13 +131,18 @@ def read_cminfo_from_redis(return_as, redishost='redishost'):
     return_as : str
                 If return_as 'dict': returns dict as per old cminfo
                 If return_as 'namespace':  returns as a Namespace for other places
-    redishost : str
-                Name of redis host.
+    redishost : str or redis.Redis
+                Name of redis host, or a redis client.
 
     Returns
     -------
     dict (or Namespace) of cminfo
 
+    Notes
+    -----
+    The parsed result is cached per redis server until the cm_version stored in
+    cminfo changes. Each call returns its own deep copy of the cached result.
+
     """
     if not isinstance(return_as, string_type):
         raise ValueError(
@@ -119,20 +154,35 @@ def read_cminfo_from_redis(return_as, redishost='redishost'):
             "Input return_as must be one of {}".format(["dict", "dictionary", "namespace"])
         )
 
-    cminfo = {}
-
-    redis_pool = redis.ConnectionPool(host=redishost, decode_responses=True)
-    redishost = redis.Redis(connection_pool=redis_pool)
-
-    cminfo_redis = redishost.hgetall("cminfo")
-
-    for k in cminfo_redis.keys():
-        cminfo[k] = json.loads(cminfo_redis[k])
-
-    # return if dictionary tpye was desired
-    if return_as.lower().startswith('dict'):
-        return cminfo
-
+    redishost = _get_redis(redishost)
+    conn_kwargs = redishost.connection_pool.connection_kwargs
+    server = (conn_kwargs.get("host"), conn_kwargs.get("port"), conn_kwargs.get("path"),
+              conn_kwargs.get("db"))
+
+    # Holding the lock while reading makes concurrent callers share one refresh.
+    with _cminfo_lock:
+        version = redishost.hget("cminfo", "cm_version")
+        cached = _cminfo_cache.get(server)
+        if version is None or cached is None or cached["version"] != version:
+            cminfo = {}
+            cminfo_redis = redishost.hgetall("cminfo")
+            for k in cminfo_redis.keys():
+                cminfo[k] = json.loads(cminfo_redis[k])
+            cached = {"version": version, "dict": cminfo, "namespace": None}
+            if version is not None:
+                _cminfo_cache[server] = cached
+
+        # return if dictionary tpye was desired
+        if return_as.lower().startswith('dict'):
+            return copy.deepcopy(cached["dict"])
+
+        if cached["namespace"] is None:
+            cached["namespace"] = _cminfo_to_namespace(cached["dict"])
+        return copy.deepcopy(cached["namespace"])
+
+
+def _cminfo_to_namespace(cminfo):
+    """Convert a cminfo dict into a Namespace, adding the derived location fields."""
     from argparse import Namespace
 
     loc = Namespace()
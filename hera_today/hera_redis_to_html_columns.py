@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import os
 import time
 import redis
 import datetime
@@ -87,67 +88,89 @@ h3 {
 </head>
 """
 
+OUTFILE = "/var/www/html/nodes.html"
+
 current_col = 0
 cols = {"ant":1, "node":2, "snap":3}
 
-with open("/var/www/html/nodes.html", "w") as fh:
-  fh.write("<html>\n")
-  fh.write(html_header)
-  fh.write("  <body>\n")
-  fh.write("    <h0>{time:s} UTC</h0>\n".format(time.ctime()))
-  # First print scripts status
-  for k in sorted(r.keys()):
-    if k.startswith("status:script:"):
-      fh.write("<h1>{name:s}: "
-               "{key:s}</h1>".format(name=k.lstrip("status:script:"),
-                                     key=r[k])
-               )
-  fh.write(start_row())
-  for k in sorted(r.keys()):
-    if k.startswith("status:"):
-      stattype = k.split(":")[1]
-      if stattype not in list(cols.keys()):
+# A single non-blocking SCAN for all status keys, rather than KEYS over the
+# whole keyspace. SCAN can return a key more than once, so de-duplicate.
+status_keys = sorted(set(r.scan_iter(match="status:*", count=500)))
+script_keys = [k for k in status_keys if k.startswith("status:script:")]
+stat_keys = [k for k in status_keys if k.split(":")[1] in cols]
+
+# Fetch every script value and status hash in one round trip.
+pipe = r.pipeline(transaction=False)
+for k in script_keys:
+  pipe.get(k)
+for k in stat_keys:
+  pipe.hgetall(k)
+replies = pipe.execute()
+script_vals = replies[:len(script_keys)]
+stat_hashes = replies[len(script_keys):]
+
+# Build the page in memory, then write it out in one go.
+html = []
+append = html.append
+append("<html>\n")
+append(html_header)
+append("  <body>\n")
+append("    <h0>{time:s} UTC</h0>\n".format(time=time.ctime()))
+# First print scripts status
+for k, v in zip(script_keys, script_vals):
+  append("<h1>{name:s}: "
+         "{key:s}</h1>".format(name=k[len("status:script:"):],
+                               key=v)
+         )
+append(start_row())
+# Every timestamp is compared against the same wall clock.
+now = datetime.datetime.now()
+for k, x in zip(stat_keys, stat_hashes):
+    stattype = k.split(":")[1]
+    if current_col != cols[stattype]:
+        if current_col != 0:
+            append(end_column())
+        append(start_column())
+        current_col = cols[stattype]
+    append("    <h2>{key:s}</h2>\n".format(key=k))
+    for key, val in sorted(x.items()):
+      if key.startswith('histogram'):
           continue
-      if current_col != cols[stattype]:
-          if current_col != 0:
-              fh.write(end_column())
-          fh.write(start_column())
-          current_col = cols[stattype]
-      fh.write("    <h2>{key:s}</h2>\n".format(key=k))
-      x = r.hgetall(k)
-      for key, val in sorted(x.items()):
-        if key.startswith('histogram'):
-            continue
-        if key.startswith("eq"):
-          if val != "None":
-              val = "%s..." % json.loads(val)[0:3]
-        if key.startswith("power"):
-          if val == "0":
+      if key.startswith("eq"):
+        if val != "None":
+            val = "%s..." % json.loads(val)[0:3]
+      if key.startswith("power"):
+        if val == "0":
+          style = "color:red;"
+        else:
+          style = "color:green;"
+      elif key == 'timestamp':
+          if "T" in val[:20]:
+              then = datetime.datetime.strptime(val, "%Y-%m-%dT%H:%M:%S.%f")
+          else:
+              then = datetime.datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
+          diff = now - then
+          val += " UTC" # Print the timezone for clarity
+          if diff.total_seconds() > 60:
             style = "color:red;"
           else:
             style = "color:green;"
-        elif key == 'timestamp':
-            try:
-                then = datetime.datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
-            except:
-                then = datetime.datetime.strptime(val, "%Y-%m-%dT%H:%M:%S.%f")
-            now  = datetime.datetime.now()
-            diff = now - then
-            val += " UTC" # Print the timezone for clarity
-            if diff.total_seconds() > 60:
-              style = "color:red;"
-            else:
-              style = "color:green;"
-        else:
-          style = "color:black;"
-        fh.write("      <h3 style=\"{style:s}\"><pre "
-                 "class='tab'>{key:s}: {val:s}</pre></h3>\n"
-                 .format(style=style, key=key, val=val.replace('\n', '<br>'))
-                 )
-      fh.write("\n")
-      fh.write("<hr>\n")
-
-  fh.write(end_column())
-  fh.write(end_row())
-  fh.write("  </body>\n")
-  fh.write("</html>\n")
+      else:
+        style = "color:black;"
+      append("      <h3 style=\"{style:s}\"><pre "
+             "class='tab'>{key:s}: {val:s}</pre></h3>\n"
+             .format(style=style, key=key, val=val.replace('\n', '<br>'))
+             )
+    append("\n")
+    append("<hr>\n")
+
+append(end_column())
+append(end_row())
+append("  </body>\n")
+append("</html>\n")
+
+# Write to a temporary file and move it into place, so the page refresh never
+# picks up a half-written file.
+with open(OUTFILE + ".tmp", "w") as fh:
+  fh.write("".join(html))
+os.replace(OUTFILE + ".tmp", OUTFILE)
@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+import gzip
+import io
+import os
 import time
 import redis
 import numpy as np
@@ -8,7 +11,10 @@ from astropy.time import Time
 # Two redis instances run on this server.
 # port 6379 is the hera-digi mirror
 # port 6380 is the paper1 mirror
-r = redis.Redis('localhost', 6379, decode_responses=True)
+# The autocorrelations and timestamp are raw binary, so don't decode replies.
+r = redis.Redis('localhost', 6379)
+
+OUTFILE = '/var/www/html/powers.html'
 
 n_ants = 192
 # Generate frequency axis
@@ -18,7 +24,7 @@ NCHAN_SUM = 4
 frange = np.linspace(0, 250e6, NCHANS_F + 1)[1536:1536 + (8192 // 4 * 3)]
 # average over channels
 frange = frange.reshape(NCHANS, NCHAN_SUM).sum(axis=1) / NCHAN_SUM
-frange_str = ', '.join('{freq:f}'.format(freq=freq)for freq in frange)
+frange_str = ', '.join(map('{:f}'.format, frange.tolist()))
 linenames = []
 
 # All this code does is build an html file
@@ -61,53 +67,74 @@ html_postamble = '''
 </html>
 '''
 
-got_time = False
+# Fetch the plot time and every autocorrelation in one round trip.
+ant_pols = [(i, pol) for i in range(n_ants) for pol in ['e', 'n']]
+vals = r.mget(['auto:timestamp']
+              + ['auto:{ant:d}{pol:s}'.format(ant=i, pol=pol)
+                 for i, pol in ant_pols])
+timestamp, autos = vals[0], vals[1:]
+
+# Keep the ant-pols that have a full spectrum and convert them all to dB at once.
+found = []
+spectra = []
+for (i, pol), d in zip(ant_pols, autos):
+  if d is None:
+    continue
+  if len(d) < 4 * NCHANS:
+    print('Skipping ant{ant:d}{pol:s}: only {n:d} bytes of data'.format(ant=i, pol=pol, n=len(d)))
+    continue
+  found.append((i, pol))
+  spectra.append(np.frombuffer(d, dtype=np.float32, count=NCHANS))
+spectra = np.array(spectra)
+np.maximum(spectra, 10**-2.5, out=spectra)
+spectra = 10 * np.log10(spectra)
+
+# Format every spectrum as text in one pass, one line per ant-pol. A thousandth
+# of a dB is more precision than the plot can show.
+buf = io.StringIO()
+np.savetxt(buf, spectra, fmt='%.3f', delimiter=', ')
+spectra_strs = buf.getvalue().splitlines()
+
+# Get time of plot
+t_plot_jd = np.frombuffer(timestamp, dtype=np.float64, count=1)[0]
+t_plot_unix = Time(t_plot_jd, format='jd').unix
+print(t_plot_jd, t_plot_unix)
+
+# Build the page in memory, then write it out in one go.
 n_signals = 0
-with open('/var/www/html/powers.html', 'w') as fh:
-  fh.write(html_preamble)
-  fh.write(plotly_preamble)
-  # Get time of plot
-  t_plot_jd = np.fromstring(r['auto:timestamp'], dtype=np.float64)[0]
-  t_plot_unix = Time(t_plot_jd, format='jd').unix
-  print(t_plot_jd, t_plot_unix)
-  got_time = True
-  # grab data from redis and format it according to plotly's javascript api
-  for i in range(n_ants):
-    for pol in ['e', 'n']:
-        # get the timestamp from redis for the first ant-pol
-        if not got_time:
-            t_plot_jd = float(r.hget('visdata://{i:d}/{j:d}/{i_pol:s}{j_pol:s}'
-                                     .format(i=i, j=i, i_pol=pol, j_pol=pol),
-                                     'time'
-                                     )
-                              )
-
-            if t_plot_jd is not None:
-                t_plot_unix = Time(t_plot_jd, format='jd').unix
-                got_time = True
-        linename = 'ant{ant:d}{pol:s}'.format(ant=i, pol=pol)
-        d = r.get('auto:{ant:d}{pol:s}'.format(ant=i, pol=pol))
-        #r.hget('visdata://%d/%d/%s%s' % (i,i,pol,pol), 'data')
-        if d is not None:
-            n_signals += 1
-            linenames += [linename]
-            fh.write('{name:s} = {\n'.format(name=linename))
-            fh.write('  x: [{frange:s}],\n'.format(frange=frange_str))
-            f = np.fromstring(d, dtype=np.float32)[0:NCHANS]
-            f[f<10**-2.5] = 10**-2.5
-            f = 10*np.log10(f)
-            f_str = ', '.join('{freq:f}'.format(freq=freq) for freq in f)
-            fh.write('  y: [{f_str:s}],\n'.format(f_str=f_str))
-            fh.write("  name: '{name:s}',\n".format(name=linename))
-            fh.write("  type: 'scatter'\n")
-            fh.write('};\n')
-            fh.write('\n')
-  fh.write('data = [{name:s}];\n'.format(name=', '.join(linenames)))
-
-  fh.write(plotly_postamble)
-  fh.write('<p>Plots from {unix:s} UTC (JD: {jd:f})</p>\n'.format(unix=time.ctime(t_plot_unix), jd=t_plot_jd))
-  fh.write('<p>Queried on {now:s} UTC</p>\n'.format(now=time.ctime()))
-  #fh.write('<p>CMINFO source: %s</p>\n' % r['cminfo_source'])
-  fh.write(html_postamble)
+html = [html_preamble, plotly_preamble]
+append = html.append
+# every trace shares the same frequency axis, so write it out only once
+append('var xs = [{frange:s}];\n\n'.format(frange=frange_str))
+# format the data according to plotly's javascript api
+for (i, pol), f_str in zip(found, spectra_strs):
+  linename = 'ant{ant:d}{pol:s}'.format(ant=i, pol=pol)
+  n_signals += 1
+  linenames += [linename]
+  append('{name:s} = {{\n'
+         '  x: xs,\n'
+         '  y: [{f_str:s}],\n'
+         "  name: '{name:s}',\n"
+         "  type: 'scatter'\n"
+         '}};\n'
+         '\n'.format(name=linename, f_str=f_str))
+append('data = [{name:s}];\n'.format(name=', '.join(linenames)))
+
+append(plotly_postamble)
+append('<p>Plots from {unix:s} UTC (JD: {jd:f})</p>\n'.format(unix=time.ctime(t_plot_unix), jd=t_plot_jd))
+append('<p>Queried on {now:s} UTC</p>\n'.format(now=time.ctime()))
+#append('<p>CMINFO source: %s</p>\n' % r['cminfo_source'])
+append(html_postamble)
+
+# Write to a temporary file and move it into place, so the page refresh never
+# picks up a half-written file.
+page = ''.join(html)
+with open(OUTFILE + '.tmp', 'w') as fh:
+  fh.write(page)
+os.replace(OUTFILE + '.tmp', OUTFILE)
+# Also keep a pre-compressed copy for web servers serving static gzip files.
+with gzip.open(OUTFILE + '.gz.tmp', 'wt', compresslevel=1) as fh:
+  fh.write(page)
+os.replace(OUTFILE + '.gz.tmp', OUTFILE + '.gz')
 
 print('Got {n_sig:d} signals'.format(n_sig=n_signals))
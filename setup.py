@@ -20,7 +20,8 @@ with open(os.path.join(here, 'hera_corr_cm', '__version__.py'), 'w') as fh:
 
 PACKAGES = find_packages()
 print(PACKAGES)
-REQUIRES = ["redis", "pyyaml"]
+# redis>=3.5 for hset(mapping=...) and health_check_interval
+REQUIRES = ["redis>=3.5", "hiredis", "pyyaml", "numpy", "python-dateutil", "astropy"]
 
 setup_args = dict(name="hera_corr",
                   maintainer="HERA Team",
@@ -29,7 +30,7 @@ setup_args = dict(name="hera_corr",
                   version=VERSION,
                   packages=PACKAGES,
                   scripts=glob.glob('scripts/*'),
-                  requires=REQUIRES)
+                  install_requires=REQUIRES)
 
 if __name__ == '__main__':
     setup(**setup_args)